@@ -1,7 +1,6 @@
-import copy
 import gzip
 import json
-from functools import partial
+from functools import lru_cache, partial
 from numbers import Number
 from pathlib import Path
 from typing import Union
@@ -25,7 +24,9 @@ def add_suffix(root: Union[Path, str], suffix: str) -> Path:
 
 def write_json_file(data, name):
     with open(dirpath / add_suffix(name, ".json"), "w", encoding="utf-8") as fp:
-        json.dump(data, fp, ensure_ascii=False, indent=2)
+        # Serialize once and write once; ``json.dump`` with ``indent`` makes
+        # thousands of tiny ``fp.write`` calls for large migration payloads
+        fp.write(json.dumps(data, ensure_ascii=False, indent=2))
 
 
 def get_csv_example_filepath():
@@ -36,8 +37,18 @@ def get_xlsx_example_filepath():
     return dirpath / "examples" / "example.xlsx"
 
 
+@lru_cache(maxsize=8)
+def _load_workbook(path):
+    return load_workbook(path, read_only=True, data_only=True)
+
+
 def get_sheet(path, name):
-    return load_workbook(path)[name]
+    return _load_workbook(path)[name]
+
+
+def clear_workbook_cache():
+    """Drop cached workbooks to release open file handles and memory."""
+    _load_workbook.cache_clear()
 
 
 # def get_ecoinvent_301_31_migration_data():
@@ -112,36 +123,23 @@ def get_biosphere_2_3_name_migration_data():
         dirpath / "lci" / "ecoinvent elementary flows 2-3.xlsx", "ElementaryExchanges"
     )
 
-    def to_exchange(obj):
-        obj[0][3] = "biosphere"
-        return obj
-
     def strip_unspecified(one, two):
         if two == "unspecified":
             return (one,)
         else:
             return (one, two)
 
-    data = [
-        (
-            [
-                ws.cell(row=row + 1, column=2).value,  # Old name
-                # Categories
-                strip_unspecified(
-                    ws.cell(row=row + 1, column=10).value,
-                    ws.cell(row=row + 1, column=11).value,
-                ),
-                normalize_units(ws.cell(row=row + 1, column=7).value),
-                "emission",  # Unit
-            ],
-            {"name": ws.cell(row=row + 1, column=9).value},
-        )
-        for row in range(1, ws.max_row)
-        if ws.cell(row=row + 1, column=2).value
-        and ws.cell(row=row + 1, column=9).value
-        and ws.cell(row=row + 1, column=2).value != ws.cell(row=row + 1, column=9).value
-    ]
-    data = copy.deepcopy(data) + [to_exchange(obj) for obj in data]
+    # One row for datasets ("emission") and one for exchanges ("biosphere"),
+    # built in a single pass - no deepcopy needed as each list is fresh.
+    data = []
+    for row in ws.iter_rows(min_row=2, values_only=True):
+        old, new = row[1], row[8]
+        if not old or not new or old == new:
+            continue
+        categories = strip_unspecified(row[9], row[10])
+        unit = normalize_units(row[6])
+        data.append(([old, categories, unit, "emission"], {"name": new}))
+        data.append(([old, categories, unit, "biosphere"], {"name": new}))
 
     # Water unit changes
     data.extend(
@@ -211,11 +209,10 @@ def convert_simapro_ecoinvent_elementary_flows():
     Uses custom SimaPro specific data. Ecoinvent 2 -> 3 conversion is in a separate JSON file.
     """
     ws = get_sheet(dirpath / "lci" / "SimaPro - ecoinvent - biosphere.xlsx", "ee")
-    data = [
-        [ws.cell(row=row + 1, column=col + 1).value for col in range(3)]
-        for row in range(1, ws.max_row)
-    ]
-    data = {(SIMAPRO_BIOSPHERE[obj[0]], obj[1], obj[2]) for obj in data}
+    data = {
+        (SIMAPRO_BIOSPHERE[row[0]], row[1], row[2])
+        for row in ws.iter_rows(min_row=2, max_col=3, values_only=True)
+    }
     write_json_file(sorted(data), "simapro-biosphere")
 
 
@@ -233,12 +230,12 @@ def convert_simapro_ecoinvent_3_migration_data():
             dirpath / "lci" / "SimaPro - ecoinvent - technosphere.xlsx", ws_name
         )
         data = [
-            [ws.cell(row=row + 1, column=col + 1).value for col in range(1, 6)]
-            for row in range(3, ws.max_row)
+            list(row)
+            for row in ws.iter_rows(
+                min_row=4, min_col=2, max_col=6, values_only=True
+            )
         ]
-        fp = os.path.join(
-            dirpath, "lci", "Simapro - ecoinvent {} mapping.gzip".format(version)
-        )
+        fp = dirpath / "lci" / "Simapro - ecoinvent {} mapping.gzip".format(version)
         with gzip.GzipFile(fp, "w") as fout:
             fout.write(json.dumps(data, ensure_ascii=False).encode("utf-8"))
 
@@ -292,8 +289,7 @@ def convert_ecoinvent_2_301():
         dirpath / "lci" / "ecoinvent 2-3.01.xlsx", "correspondence sheet_corrected"
     )
     data = [
-        [ws.cell(row=row + 1, column=col + 1).value for col in range(17)]
-        for row in range(1, ws.max_row)
+        list(row) for row in ws.iter_rows(min_row=2, max_col=17, values_only=True)
     ]
     data = {
         "fields": ["name", "location"],
@@ -373,27 +369,26 @@ def convert_lcia_methods_data():
     sheet = get_sheet(dirpath / "lcia" / filename, "CFs")
 
     def process_row(row):
-        data = [cell.value for i, cell in zip(range(8), row)]
-        if not isinstance(data[-1], Number):
+        if not isinstance(row[7], Number):
             return None
         else:
             return {
-                "method": tuple(data[:3]),
-                "name": data[3],
-                "categories": tuple(data[4:6]),
-                "amount": data[6],
+                "method": tuple(row[:3]),
+                "name": row[3],
+                "categories": tuple(row[4:6]),
+                "amount": row[6],
             }
 
-    cf_data = [process_row(row) for rowidx, row in enumerate(sheet.rows) if rowidx]
+    cf_data = [
+        process_row(row)
+        for row in sheet.iter_rows(min_row=2, max_col=8, values_only=True)
+    ]
 
     sheet = get_sheet(dirpath / "lcia" / filename, "Indicators")
 
-    def process_unit_row(row):
-        data = [cell.value for i, cell in zip(range(4), row)]
-        return tuple(data[:3]), data[3]
-
     units = dict(
-        process_unit_row(row) for rowidx, row in enumerate(sheet.rows) if rowidx
+        (tuple(row[:3]), row[3])
+        for row in sheet.iter_rows(min_row=2, max_col=4, values_only=True)
     )
 
     return csv_data, cf_data, units, filename
@@ -22,6 +22,25 @@ class StrategyError(Exception):
     pass
 
 
+class NonuniqueLinkError(StrategyError):
+    """A dataset can't be uniquely linked to the target database.
+
+    Formatting the error message pretty-prints every colliding dataset, which
+    is expensive; it is deferred until the exception is actually stringified.
+    """
+
+    def __init__(self, obj, fields, others):
+        super().__init__()
+        self.obj = obj
+        self.fields = fields
+        self.others = others
+
+    def __str__(self):
+        from .strategies.generic import format_nonunique_key_error
+
+        return format_nonunique_key_error(self.obj, self.fields, self.others)
+
+
 class NonuniqueCode(Exception):
     """Not all provided codes are unique"""
 
@@ -1,8 +1,11 @@
 import math
 import multiprocessing
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
-from lxml import objectify
+import numpy as np
+from lxml import etree
 from stats_arrays.distributions import (
     LognormalUncertainty,
     NormalUncertainty,
@@ -12,6 +15,13 @@ from stats_arrays.distributions import (
 )
 from tqdm import tqdm
 
+NS = "{http://www.EcoInvent.org/EcoSpold02}"
+
+TEXT_TAG = NS + "text"
+IMAGE_URL_TAG = NS + "imageUrl"
+INTERMEDIATE_EXCHANGE_TAG = NS + "intermediateExchange"
+ELEMENTARY_EXCHANGE_TAG = NS + "elementaryExchange"
+
 PM_MAPPING = {
     "reliability": "reliability",
     "completeness": "completeness",
@@ -20,6 +30,14 @@ PM_MAPPING = {
     "furtherTechnologyCorrelation": "further technological correlation",
 }
 
+PM_ITEMS = tuple(PM_MAPPING.items())
+
+EXCHANGE_KINDS = {
+    (False, True): "production",
+    (True, False): "biosphere",
+    (False, False): "technosphere",
+}
+
 ACTIVITY_TYPES = {
     0: "ordinary transforming activity",
     1: "market activity",
@@ -35,33 +53,94 @@ ACTIVITY_TYPES = {
 }
 
 
-def getattr2(obj, attr):
-    """
-    Get attribute of an object; return empty dict if AttributeError occurs.
+TOO_LOW = """Lognormal scale value at or below zero: {}.
+Reverting to undefined uncertainty."""
+TOO_HIGH = """Lognormal scale value impossibly high: {}.
+Reverting to undefined uncertainty."""
 
-    Parameters
-    ----------
-    obj : object
-        The object to get attribute from.
-    attr : str
-        The name of the attribute to get.
 
-    Returns
-    -------
-    dict
-        The attribute value if it exists, else an empty dict.
+def _lognormal_uncertainty(element, amount):
+    data = {
+        "uncertainty type": LognormalUncertainty.id,
+        "loc": float(element.get("mu")),
+        "scale": math.sqrt(float(element.get("varianceWithPedigreeUncertainty"))),
+    }
+    variance = element.get("variance")
+    if variance:
+        data["scale without pedigree"] = math.sqrt(float(variance))
+    return data
+
+
+def _normal_uncertainty(element, amount):
+    data = {
+        "uncertainty type": NormalUncertainty.id,
+        "loc": float(element.get("meanValue")),
+        "scale": math.sqrt(float(element.get("varianceWithPedigreeUncertainty"))),
+    }
+    variance = element.get("variance")
+    if variance:
+        data["scale without pedigree"] = math.sqrt(float(variance))
+    return data
+
+
+def _triangular_uncertainty(element, amount):
+    return {
+        "uncertainty type": TriangularUncertainty.id,
+        "minimum": float(element.get("minValue")),
+        "loc": float(element.get("mostLikelyValue")),
+        "maximum": float(element.get("maxValue")),
+    }
+
+
+def _uniform_uncertainty(element, amount):
+    return {
+        "uncertainty type": UniformUncertainty.id,
+        "loc": amount,
+        "minimum": float(element.get("minValue")),
+        "maximum": float(element.get("maxValue")),
+    }
+
+
+def _undefined_uncertainty(element, amount):
+    return {
+        "uncertainty type": UndefinedUncertainty.id,
+        "loc": amount,
+    }
+
+
+UNCERTAINTY_BUILDERS = {
+    "lognormal": _lognormal_uncertainty,
+    "normal": _normal_uncertainty,
+    "triangular": _triangular_uncertainty,
+    "uniform": _uniform_uncertainty,
+    "undefined": _undefined_uncertainty,
+}
 
-    """
-    try:
-        return getattr(obj, attr)
-    except:
-        return {}
+NUMERIC_EXCHANGE_FIELDS = ("amount", "production volume", "loc", "scale")
+STRING_EXCHANGE_FIELDS = ("flow", "type", "name", "unit")
 
 
-TOO_LOW = """Lognormal scale value at or below zero: {}.
-Reverting to undefined uncertainty."""
-TOO_HIGH = """Lognormal scale value impossibly high: {}.
-Reverting to undefined uncertainty."""
+def exchange_arrays(exchanges):
+    """Build a struct-of-arrays view over a list of exchange dicts.
+
+    Returns a dict mapping field names to NumPy arrays: float64 for numeric
+    fields (missing values become NaN) and object arrays for string fields.
+    This is a *view for analysis* — the canonical exchange data stays as the
+    list of dicts, which is what the importers serialize and the strategies
+    mutate.
+    """
+    count = len(exchanges)
+    arrays = {
+        field: np.fromiter(
+            (exc.get(field, float("nan")) for exc in exchanges),
+            dtype=np.float64,
+            count=count,
+        )
+        for field in NUMERIC_EXCHANGE_FIELDS
+    }
+    for field in STRING_EXCHANGE_FIELDS:
+        arrays[field] = np.array([exc.get(field) for exc in exchanges], dtype=object)
+    return arrays
 
 
 class Ecospold2DataExtractor(object):
@@ -82,11 +161,15 @@ class Ecospold2DataExtractor(object):
         """
 
         def extract_metadata(o):
-            return {"name": o.name.text, "unit": o.unitName.text, "id": o.get("id")}
+            return {
+                "name": o.findtext(NS + "name"),
+                "unit": o.findtext(NS + "unitName"),
+                "id": o.get("id"),
+            }
 
         fp = os.path.join(dirpath, "IntermediateExchanges.xml")
         assert os.path.exists(fp), "Can't find IntermediateExchanges.xml"
-        root = objectify.parse(open(fp, encoding="utf-8")).getroot()
+        root = etree.parse(fp).getroot()
         return [extract_metadata(ds) for ds in root.iterchildren()]
 
     @classmethod
@@ -116,11 +199,12 @@ class Ecospold2DataExtractor(object):
         """
         assert os.path.exists(dirpath)
         if os.path.isdir(dirpath):
+            # ``scandir`` reuses the directory entry metadata instead of an
+            # extra ``stat`` call per file; matters with 20k .spold files
             filelist = [
-                filename
-                for filename in os.listdir(dirpath)
-                if os.path.isfile(os.path.join(dirpath, filename))
-                and filename.split(".")[-1].lower() == "spold"
+                entry.name
+                for entry in os.scandir(dirpath)
+                if entry.is_file() and entry.name.split(".")[-1].lower() == "spold"
             ]
         elif os.path.isfile(dirpath):
             filelist = [dirpath]
@@ -133,19 +217,26 @@ class Ecospold2DataExtractor(object):
             )
 
         if use_mp:
-            with multiprocessing.Pool(processes=multiprocessing.cpu_count()) as pool:
-                print("Extracting XML data from {} datasets".format(len(filelist)))
-                results = [
-                    pool.apply_async(
-                        Ecospold2DataExtractor.extract_activity,
-                        args=(dirpath, x, db_name),
+            print("Extracting XML data from {} datasets".format(len(filelist)))
+            with ProcessPoolExecutor(
+                max_workers=multiprocessing.cpu_count()
+            ) as executor:
+                # ``chunksize`` amortizes pickling overhead over batches of
+                # small files instead of one task per .spold
+                data = list(
+                    tqdm(
+                        executor.map(
+                            partial(cls.extract_activity, dirpath, db_name=db_name),
+                            filelist,
+                            chunksize=32,
+                        ),
+                        total=len(filelist),
+                        unit="file",
                     )
-                    for x in filelist
-                ]
-                data = [p.get() for p in results]
+                )
         else:
             data = []
-            for index, filename in enumerate(tqdm(filelist)):
+            for filename in tqdm(filelist, unit="file"):
                 data.append(cls.extract_activity(dirpath, filename, db_name))
 
         return data
@@ -168,21 +259,19 @@ class Ecospold2DataExtractor(object):
             str: The concatenated text of all child elements with the tag
             "{http://www.EcoInvent.org/EcoSpold02}text" and the text of all child
             elements with the tag "{http://www.EcoInvent.org/EcoSpold02}imageUrl".
-            If an error occurs, an empty string is returned.
+            If the element is missing or an error occurs, an empty string is
+            returned.
         """
+        if element is None:
+            return ""
         try:
-            return "\n".join(
-                [
-                    child.text
-                    for child in element.iterchildren()
-                    if child.tag == "{http://www.EcoInvent.org/EcoSpold02}text"
-                ]
-                + [
-                    "Image: " + child.text
-                    for child in element.iterchildren()
-                    if child.tag == "{http://www.EcoInvent.org/EcoSpold02}imageUrl"
-                ]
-            )
+            texts, images = [], []
+            for child in element.iterchildren():
+                if child.tag == TEXT_TAG:
+                    texts.append(child.text)
+                elif child.tag == IMAGE_URL_TAG:
+                    images.append("Image: " + child.text)
+            return "\n".join(texts + images)
         except:
             return ""
 
@@ -221,42 +310,48 @@ class Ecospold2DataExtractor(object):
                     - "email": str. The email of the author.
                 - "type": str. The type of the activity.
         """
-        root = objectify.parse(
-            open(os.path.join(dirpath, filename), encoding="utf-8")
-        ).getroot()
-        if hasattr(root, "activityDataset"):
-            stem = root.activityDataset
-        else:
-            stem = root.childActivityDataset
+        # ``iterparse`` with a tag filter skips building Python wrappers for
+        # everything except the (child)activityDataset subtree we care about.
+        stem = None
+        for _, elem in etree.iterparse(
+            os.path.join(dirpath, filename),
+            events=("end",),
+            tag=(NS + "activityDataset", NS + "childActivityDataset"),
+        ):
+            stem = elem
+
+        description = stem.find(NS + "activityDescription")
+        activity = description.find(NS + "activity")
+        geography = description.find(NS + "geography")
+        flow_data = stem.find(NS + "flowData")
+        admin = stem.find(NS + "administrativeInformation")
+        data_entry = admin.find(NS + "dataEntryBy")
+        data_generator = admin.find(NS + "dataGeneratorAndPublication")
 
         comments = [
-            cls.condense_multiline_comment(
-                getattr2(stem.activityDescription.activity, "generalComment")
-            ),
+            cls.condense_multiline_comment(activity.find(NS + "generalComment")),
             (
                 "Included activities start: ",
-                getattr2(stem.activityDescription.activity, "includedActivitiesStart"),
+                activity.findtext(NS + "includedActivitiesStart") or "",
             ),
             (
                 "Included activities end: ",
-                getattr2(stem.activityDescription.activity, "includedActivitiesEnd"),
+                activity.findtext(NS + "includedActivitiesEnd") or "",
             ),
             (
                 "Geography: ",
-                cls.condense_multiline_comment(
-                    getattr2(stem.activityDescription.geography, "comment")
-                ),
+                cls.condense_multiline_comment(geography.find(NS + "comment")),
             ),
             (
                 "Technology: ",
                 cls.condense_multiline_comment(
-                    getattr2(stem.activityDescription.technology, "comment")
+                    description.find(NS + "technology/" + NS + "comment")
                 ),
             ),
             (
                 "Time period: ",
                 cls.condense_multiline_comment(
-                    getattr2(stem.activityDescription.timePeriod, "comment")
+                    description.find(NS + "timePeriod/" + NS + "comment")
                 ),
             ),
         ]
@@ -269,58 +364,52 @@ class Ecospold2DataExtractor(object):
         )
 
         classifications = [
-            (el.classificationSystem.text, el.classificationValue.text)
-            for el in stem.activityDescription.iterchildren()
-            if el.tag == "{http://www.EcoInvent.org/EcoSpold02}classification"
+            (
+                el.findtext(NS + "classificationSystem"),
+                el.findtext(NS + "classificationValue"),
+            )
+            for el in description.iterchildren(NS + "classification")
         ]
 
         data = {
             "comment": comment,
             "classifications": classifications,
             "activity type": ACTIVITY_TYPES[
-                int(stem.activityDescription.activity.get("specialActivityType") or 0)
+                int(activity.get("specialActivityType") or 0)
             ],
-            "activity": stem.activityDescription.activity.get("id"),
+            "activity": activity.get("id"),
             "database": db_name,
             "exchanges": [
                 cls.extract_exchange(exc)
-                for exc in stem.flowData.iterchildren()
+                for exc in flow_data.iterchildren()
                 if "parameter" not in exc.tag
             ],
             "filename": os.path.basename(filename),
-            "location": stem.activityDescription.geography.shortname.text,
-            "name": stem.activityDescription.activity.activityName.text,
+            "location": geography.findtext(NS + "shortname"),
+            "name": activity.findtext(NS + "activityName"),
             "synonyms": [
-                s.text
-                for s in getattr(stem.activityDescription.activity, "synonym", [])
+                s.text for s in activity.iterchildren(NS + "synonym")
             ],
             "parameters": dict(
                 [
                     cls.extract_parameter(exc)
-                    for exc in stem.flowData.iterchildren()
+                    for exc in flow_data.iterchildren()
                     if "parameter" in exc.tag
                 ]
             ),
             "authors": {
                 "data entry": {
-                    "name": stem.administrativeInformation.dataEntryBy.get(
-                        "personName"
-                    ),
-                    "email": stem.administrativeInformation.dataEntryBy.get(
-                        "personEmail"
-                    ),
+                    "name": data_entry.get("personName"),
+                    "email": data_entry.get("personEmail"),
                 },
                 "data generator": {
-                    "name": stem.administrativeInformation.dataGeneratorAndPublication.get(
-                        "personName"
-                    ),
-                    "email": stem.administrativeInformation.dataGeneratorAndPublication.get(
-                        "personEmail"
-                    ),
+                    "name": data_generator.get("personName"),
+                    "email": data_generator.get("personEmail"),
                 },
             },
             "type": "process",
         }
+        stem.clear()
         return data
 
     @classmethod
@@ -360,91 +449,42 @@ class Ecospold2DataExtractor(object):
         Returns:
             dict: The extracted uncertainty information.
         """
-        data = {
-            "amount": float(obj.get("amount")),
-        }
-        if hasattr(obj, "uncertainty"):
-            unc = obj.uncertainty
-            if hasattr(unc, "pedigreeMatrix"):
-                data["pedigree"] = dict(
-                    [
-                        (PM_MAPPING[key], int(unc.pedigreeMatrix.get(key)))
-                        for key in PM_MAPPING
-                    ]
-                )
-
-            if hasattr(unc, "lognormal"):
-                data.update(
-                    {
-                        "uncertainty type": LognormalUncertainty.id,
-                        "loc": float(unc.lognormal.get("mu")),
-                        "scale": math.sqrt(
-                            float(unc.lognormal.get("varianceWithPedigreeUncertainty"))
-                        ),
-                    }
-                )
-                if unc.lognormal.get("variance"):
-                    data["scale without pedigree"] = math.sqrt(
-                        float(unc.lognormal.get("variance"))
-                    )
-                if data["scale"] <= 0:
-                    cls.abort_exchange(data, TOO_LOW.format(data["scale"]))
-                elif data["scale"] > 25:
-                    cls.abort_exchange(data, TOO_HIGH.format(data["scale"]))
-            elif hasattr(unc, "normal"):
-                data.update(
-                    {
-                        "uncertainty type": NormalUncertainty.id,
-                        "loc": float(unc.normal.get("meanValue")),
-                        "scale": math.sqrt(
-                            float(unc.normal.get("varianceWithPedigreeUncertainty"))
-                        ),
-                    }
-                )
-                if unc.normal.get("variance"):
-                    data["scale without pedigree"] = math.sqrt(
-                        float(unc.normal.get("variance"))
-                    )
-                if data["scale"] <= 0:
-                    cls.abort_exchange(data)
-            elif hasattr(unc, "triangular"):
-                data.update(
-                    {
-                        "uncertainty type": TriangularUncertainty.id,
-                        "minimum": float(unc.triangular.get("minValue")),
-                        "loc": float(unc.triangular.get("mostLikelyValue")),
-                        "maximum": float(unc.triangular.get("maxValue")),
-                    }
-                )
-                if data["minimum"] >= data["maximum"]:
-                    cls.abort_exchange(data)
-            elif hasattr(unc, "uniform"):
-                data.update(
-                    {
-                        "uncertainty type": UniformUncertainty.id,
-                        "loc": data["amount"],
-                        "minimum": float(unc.uniform.get("minValue")),
-                        "maximum": float(unc.uniform.get("maxValue")),
-                    }
-                )
-                if data["minimum"] >= data["maximum"]:
-                    cls.abort_exchange(data)
-            elif hasattr(unc, "undefined"):
-                data.update(
-                    {
-                        "uncertainty type": UndefinedUncertainty.id,
-                        "loc": data["amount"],
-                    }
-                )
-            else:
-                raise ValueError("Unknown uncertainty type")
-        else:
-            data.update(
-                {
-                    "uncertainty type": UndefinedUncertainty.id,
-                    "loc": data["amount"],
+        amount = float(obj.get("amount"))
+        data = {"amount": amount}
+        unc = obj.find(NS + "uncertainty")
+        if unc is None:
+            data["uncertainty type"] = UndefinedUncertainty.id
+            data["loc"] = amount
+            return data
+
+        # Dispatch on the child tag instead of a chain of ``hasattr`` calls,
+        # each of which costs a failed namespaced attribute lookup.
+        builder = None
+        for child in unc.iterchildren():
+            tag = child.tag.rsplit("}", 1)[-1]
+            if tag == "pedigreeMatrix":
+                pm_get = child.get
+                data["pedigree"] = {
+                    label: int(pm_get(key)) for key, label in PM_ITEMS
                 }
-            )
+            elif builder is None and tag in UNCERTAINTY_BUILDERS:
+                builder = UNCERTAINTY_BUILDERS[tag]
+                data.update(builder(child, amount))
+        if builder is None:
+            raise ValueError("Unknown uncertainty type")
+
+        kind = data["uncertainty type"]
+        if kind == LognormalUncertainty.id:
+            if data["scale"] <= 0:
+                cls.abort_exchange(data, TOO_LOW.format(data["scale"]))
+            elif data["scale"] > 25:
+                cls.abort_exchange(data, TOO_HIGH.format(data["scale"]))
+        elif kind == NormalUncertainty.id:
+            if data["scale"] <= 0:
+                cls.abort_exchange(data)
+        elif kind in (TriangularUncertainty.id, UniformUncertainty.id):
+            if data["minimum"] >= data["maximum"]:
+                cls.abort_exchange(data)
         return data
 
     @classmethod
@@ -461,13 +501,15 @@ class Ecospold2DataExtractor(object):
         """
         name = exc.get("variableName")
         data = {
-            "description": exc.name.text,
+            "description": exc.findtext(NS + "name"),
             "id": exc.get("parameterId"),
         }
-        if hasattr(exc, "unitName"):
-            data["unit"] = exc.unitName.text
-        if hasattr(exc, "comment"):
-            data["comment"] = exc.comment.text
+        unit = exc.find(NS + "unitName")
+        if unit is not None:
+            data["unit"] = unit.text
+        comment = exc.find(NS + "comment")
+        if comment is not None:
+            data["comment"] = comment.text
         data.update(cls.extract_uncertainty_dict(exc))
         if name is None:
             name = "Unnamed parameter: {}".format(data["id"])
@@ -499,17 +541,18 @@ class Ecospold2DataExtractor(object):
         """
         properties = {}
 
-        for obj in exc.iterchildren():
-            if not obj.tag.endswith("property"):
-                continue
-
-            properties[obj.name.text] = {"amount": float(obj.get("amount"))}
-            if hasattr(obj, "comment"):
-                properties[obj.name.text]["comment"] = obj.comment.text
-            if hasattr(obj, "unitName"):
-                properties[obj.name.text]["unit"] = obj.unitName.text
+        for obj in exc.iterchildren(NS + "property"):
+            prop = properties[obj.findtext(NS + "name")] = {
+                "amount": float(obj.get("amount"))
+            }
+            comment = obj.find(NS + "comment")
+            if comment is not None:
+                prop["comment"] = comment.text
+            unit = obj.find(NS + "unitName")
+            if unit is not None:
+                prop["unit"] = unit.text
             if obj.get("variableName"):
-                properties[obj.name.text]["variable name"] = obj.get("variableName")
+                prop["variable name"] = obj.get("variableName")
 
         return properties
 
@@ -534,58 +577,56 @@ class Ecospold2DataExtractor(object):
             5. Stock addition
 
         """
-        if exc.tag == "{http://www.EcoInvent.org/EcoSpold02}intermediateExchange":
+        if exc.tag == INTERMEDIATE_EXCHANGE_TAG:
             flow = "intermediateExchangeId"
             is_biosphere = False
-        elif exc.tag == "{http://www.EcoInvent.org/EcoSpold02}elementaryExchange":
+        elif exc.tag == ELEMENTARY_EXCHANGE_TAG:
             flow = "elementaryExchangeId"
             is_biosphere = True
         else:
             print(exc.tag)
             raise ValueError
 
-        is_product = hasattr(exc, "outputGroup") and exc.outputGroup.text in ("0", "2")
+        output_group = exc.find(NS + "outputGroup")
+        is_product = output_group is not None and output_group.text in ("0", "2")
 
-        if is_biosphere and is_product:
+        try:
+            kind = EXCHANGE_KINDS[(is_biosphere, is_product)]
+        except KeyError:
             raise ValueError("Impossible output group")
 
-        if is_product:
-            kind = "production"
-        elif is_biosphere:
-            kind = "biosphere"
-        else:
-            kind = "technosphere"
-
+        get = exc.get
         data = {
-            "flow": exc.get(flow),
+            "flow": get(flow),
             "type": kind,
-            "name": exc.name.text,
+            "name": exc.findtext(NS + "name"),
             "classifications": {
                 "CPC": [
-                    o.classificationValue.text
-                    for o in exc.iterchildren()
-                    if "classification" in o.tag
-                    and o.classificationSystem.text == "CPC"
+                    o.findtext(NS + "classificationValue")
+                    for o in exc.iterchildren(NS + "classification")
+                    if o.findtext(NS + "classificationSystem") == "CPC"
                 ]
             },
-            "production volume": float(exc.get("productionVolumeAmount") or 0),
+            "production volume": float(get("productionVolumeAmount") or 0),
             "properties": cls.extract_properties(exc),
             # 'xml': etree.tostring(exc, pretty_print=True)
         }
         if not is_biosphere:
-            data["activity"] = exc.get("activityLinkId")
-        if hasattr(exc, "unitName"):
-            data["unit"] = exc.unitName.text
-        if hasattr(exc, "comment"):
-            data["comment"] = exc.comment.text
-        if exc.get("variableName"):
-            data["variable name"] = exc.get("variableName")
-        if exc.get("formula"):
-            data["chemical formula"] = exc.get("formula")
-        if exc.get("mathematicalRelation"):
-            data["formula"] = exc.get("mathematicalRelation")
-        if exc.get("casNumber"):
-            data["CAS number"] = exc.get("casNumber").lstrip("0")
+            data["activity"] = get("activityLinkId")
+        unit = exc.find(NS + "unitName")
+        if unit is not None:
+            data["unit"] = unit.text
+        comment = exc.find(NS + "comment")
+        if comment is not None:
+            data["comment"] = comment.text
+        if get("variableName"):
+            data["variable name"] = get("variableName")
+        if get("formula"):
+            data["chemical formula"] = get("formula")
+        if get("mathematicalRelation"):
+            data["formula"] = get("mathematicalRelation")
+        if get("casNumber"):
+            data["CAS number"] = get("casNumber").lstrip("0")
 
         data.update(cls.extract_uncertainty_dict(exc))
         return data
@@ -197,7 +197,7 @@ class SimaProCSVExtractor(object):
                 name,
             )
         )
-        with open(filepath, "r", encoding=encoding) as csv_file:
+        with open(filepath, "r", encoding=encoding, newline="") as csv_file:
             reader = csv.reader(csv_file, delimiter=delimiter)
             lines = [
                 [strip_whitespace_and_delete(obj) for obj in line] for line in reader
@@ -67,7 +67,7 @@ class SimaProLCIA95ProjectCSVExtractor:
         )
         empty_lines = lambda line: line if any(line) else None
 
-        with open(filepath, "r", encoding=encoding) as csv_file:
+        with open(filepath, "r", encoding=encoding, newline="") as csv_file:
             reader = csv.reader(csv_file, delimiter=delimiter)
             lines = [[strip_delete(elem) for elem in line] for line in reader]
 
@@ -26,9 +26,6 @@ class EndOfDatasets(Exception):
     pass
 
 
-strip_delete = lambda obj: obj.replace("\x7f", "") if isinstance(obj, str) else obj
-
-
 class SimaProLCIACSVExtractor(object):
     """
     Extract data from SimaPro LCIACSV file format.
@@ -66,12 +63,11 @@ class SimaProLCIACSVExtractor(object):
             )
         )
 
-        with open(filepath, "r", encoding=encoding) as csv_file:
-            reader = csv.reader(csv_file, delimiter=delimiter)
-            lines = [
-                strip_delete(line) if not all(i == "" for i in line) else []
-                for line in reader
-            ]
+        with open(filepath, "r", encoding=encoding, newline="") as csv_file:
+            reader = csv.reader(
+                (line.replace("\x7f", "") for line in csv_file), delimiter=delimiter
+            )
+            lines = [line if any(line) else [] for line in reader]
 
         # Check if valid SimaPro file
         assert "SimaPro" in lines[0][0], "File is not valid SimaPro export"
@@ -257,6 +253,8 @@ class SimaProLCIACSVExtractor(object):
                 }
             )
 
+        cat_index = {name: cf_data for name, _, cf_data in category_data}
+
         for ds in nw_data:
             completed_data.append(
                 {
@@ -264,7 +262,7 @@ class SimaProLCIACSVExtractor(object):
                     "name": (method_root_name, ds[0]),
                     "unit": metadata["Weighting unit"],
                     "filename": filepath,
-                    "exchanges": cls.get_all_cfs(ds[1], category_data),
+                    "exchanges": cls.get_all_cfs(ds[1], cat_index),
                 }
             )
 
@@ -282,32 +280,26 @@ class SimaProLCIACSVExtractor(object):
         return completed_data, index
 
     @classmethod
-    def get_all_cfs(cls, nw_data, category_data):
+    def get_all_cfs(cls, nw_data, cat_index):
         """
-        Get all CFs from `nw_data` and `category_data`.
+        Get all CFs from `nw_data` and `cat_index`.
 
         Parameters
         ----------
         nw_data : list
             A list of tuples containing normalization-weighting (NW) set names and scales.
-        category_data : list
-            A list of tuples containing impact category names, units, and CF data.
+        cat_index : dict
+            A mapping from impact category name to its CF data.
         Returns
         -------
         list
             A list of all CFs.
         """
-
-        def rescale(cf, scale):
-            cf["amount"] *= scale
-            return cf
-
-        cfs = []
-        for nw_name, scale in nw_data:
-            for cat_name, _, cf_data in category_data:
-                if cat_name == nw_name:
-                    cfs.extend([rescale(cf, scale) for cf in cf_data])
-        return cfs
+        return [
+            {**cf, "amount": cf["amount"] * scale}
+            for nw_name, scale in nw_data
+            for cf in cat_index.get(nw_name, ())
+        ]
 
     @classmethod
     def get_damage_exchanges(cls, damage_data, category_data):
@@ -370,15 +362,17 @@ class SimaProLCIACSVExtractor(object):
         tuple
             A tuple with the name, unit, and data for the impact category
         """
-        cf_data = []
         # First line is name and unit
         name, unit = data[index][:2]
         index += 2
         assert data[index][0] == "Substances"
         index += 1
+        # Find the block end first, then parse the whole slice in one
+        # comprehension instead of append-per-row
+        start = index
         while data[index]:
-            cf_data.append(cls.parse_cf(data[index]))
             index += 1
+        cf_data = [cls.parse_cf(line) for line in data[start:index]]
         return (name, unit, cf_data), index
 
     @classmethod
@@ -3,7 +3,6 @@ import uuid
 import warnings
 
 from bw2data import Database, Method, config, databases, mapping, methods
-from bw2data.utils import recursive_str_to_unicode
 
 from ..export.excel import write_lcia_matching
 from ..strategies import (
@@ -119,9 +118,7 @@ class LCIAImporter(ImportBase):
                     cf["code"] = str(uuid.uuid4())
                     new_flows.append(cf)
 
-        new_flows = recursive_str_to_unicode(
-            dict([self._format_flow(cf) for cf in new_flows])
-        )
+        new_flows = dict([self._format_flow(cf) for cf in new_flows])
 
         if new_flows:
             biosphere = Database(self.biosphere_name)
@@ -2,7 +2,6 @@ import json
 import os
 from pathlib import Path
 
-from bw2data.utils import recursive_str_to_unicode
 from lxml import objectify
 
 from ..strategies import (
@@ -1,12 +1,10 @@
-import numbers
+import functools
 import pprint
-from copy import deepcopy
 from typing import Iterable, List, Optional, Union
 
-import numpy as np
 from bw2data import Database, databases
 
-from ..errors import StrategyError
+from ..errors import NonuniqueLinkError, StrategyError
 from ..units import normalize_units as normalize_units_function
 from ..utils import DEFAULT_FIELDS, activity_hash
 
@@ -69,6 +67,84 @@ def format_nonunique_key_error(obj: dict, fields: List[str], others: List[dict])
     )
 
 
+def _name_block_key(obj: dict) -> str:
+    """Cheap blocking key mirroring how ``activity_hash`` normalizes ``name``."""
+    value = obj.get("name")
+    if not value:
+        return ""
+    if isinstance(value, (list, tuple)):
+        value = "".join(value)
+    return value.lower()
+
+
+def build_linking_index(other: Iterable[dict], fields: Optional[List[str]] = None):
+    """
+    Build the lookup structures ``link_iterable_by_fields`` uses to match
+    exchanges against ``other``.
+
+    Parameters
+    ----------
+    other : iterable[dict]
+        An iterable of dictionaries containing objects to link to.
+    fields : iterable[str], optional
+        An iterable of strings indicating which fields should be used to match
+        objects. If not specified, all default fields will be used.
+
+    Returns
+    -------
+    tuple
+        A tuple ``(candidates, duplicates, name_block)``: a mapping from
+        ``activity_hash`` keys to ``(database, code)``, a mapping from
+        non-unique keys to the colliding datasets, and the set of normalized
+        candidate names used for blocking.
+
+    Raises
+    ------
+    StrategyError
+        If not all datasets in ``other`` have ``database`` or ``code``
+        attributes.
+    """
+    fields = tuple(fields) if fields else DEFAULT_FIELDS
+    use_name_block = "name" in fields
+    name_block = set()
+
+    duplicates, candidates = {}, {}
+    try:
+        # Other can be a generator, so a bit convoluted
+        for ds in other:
+            key = activity_hash(ds, fields)
+            value = (ds["database"], ds["code"])
+            # ``setdefault`` inserts and detects collisions in one dict
+            # probe; identity tells us whether our fresh tuple went in
+            if candidates.setdefault(key, value) is not value:
+                duplicates.setdefault(key, []).append(ds)
+            if use_name_block:
+                name_block.add(_name_block_key(ds))
+    except KeyError:
+        raise StrategyError(
+            "Not all datasets in database to be linked have "
+            "``database`` or ``code`` attributes"
+        )
+    return candidates, duplicates, name_block
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_database_index(db_name: str, fields: Optional[tuple], modified=None):
+    """Memoized :func:`build_linking_index` over the process datasets of a
+    registered database.
+
+    Pipelines often relink against the same background database several
+    times; this amortizes the hash-index build across those calls.
+    ``modified`` is only part of the cache key - passing the database's
+    ``modified`` timestamp invalidates stale entries after a rewrite. Call
+    ``_cached_database_index.cache_clear()`` to drop the cache manually.
+    """
+    return build_linking_index(
+        (obj for obj in Database(db_name) if obj.get("type", "process") == "process"),
+        list(fields) if fields else None,
+    )
+
+
 def link_iterable_by_fields(
     unlinked: Iterable[dict],
     other: Optional[Iterable[dict]] = None,
@@ -76,6 +152,7 @@ def link_iterable_by_fields(
     kind: Union[str, List[str]] = None,
     internal: bool = False,
     relink: bool = False,
+    precomputed_index: Optional[tuple] = None,
 ):
     """
     Link objects in ``unlinked`` to objects in ``other`` using fields ``fields``.
@@ -99,6 +176,10 @@ def link_iterable_by_fields(
     relink : bool, optional
         If `True`, link to objects that already have an `input`. Otherwise, skip objects that have
         already been linked.
+    precomputed_index : tuple, optional
+        A ``(candidates, duplicates, name_block)`` tuple from
+        :func:`build_linking_index`. When given, ``other`` is ignored and the
+        index build is skipped.
 
     Returns
     -------
@@ -153,44 +234,46 @@ def link_iterable_by_fields(
     ('db2', 'C')
     """
     if kind:
-        kind = {kind} if isinstance(kind, str) else kind
-        if relink:
-            filter_func = lambda x: x.get("type") in kind
-        else:
-            filter_func = lambda x: x.get("type") in kind and not x.get("input")
-    else:
-        if relink:
-            filter_func = lambda x: True
-        else:
-            filter_func = lambda x: not x.get("input")
+        kind = {kind} if isinstance(kind, str) else set(kind)
+
+    # Normalize once so neither the index build nor the per-exchange hash
+    # calls re-evaluate ``fields or DEFAULT_FIELDS``
+    fields = tuple(fields) if fields else DEFAULT_FIELDS
+    use_name_block = "name" in fields
 
     if internal:
         other = unlinked
 
-    duplicates, candidates = {}, {}
-    try:
-        # Other can be a generator, so a bit convoluted
-        for ds in other:
-            key = activity_hash(ds, fields)
-            if key in candidates:
-                duplicates.setdefault(key, []).append(ds)
-            else:
-                candidates[key] = (ds["database"], ds["code"])
-    except KeyError:
-        raise StrategyError(
-            "Not all datasets in database to be linked have "
-            "``database`` or ``code`` attributes"
-        )
-
+    # Blocking: when ``name`` is part of the hash key, an exchange whose
+    # normalized name matches no candidate can't link, so the expensive
+    # ``activity_hash`` call is skipped for it entirely.
+    if precomputed_index is None:
+        precomputed_index = build_linking_index(other, fields)
+    candidates, duplicates, name_block = precomputed_index
+
+    # Local bindings save a global and an attribute lookup per exchange, and
+    # ``.get`` folds the membership test and item access into one dict probe.
+    # Duplicate keys are a subset of candidate keys, so the duplicates check
+    # only runs on hits.
+    hash_func = activity_hash
+    get_candidate = candidates.get
     for container in unlinked:
-        for obj in filter(filter_func, container.get("exchanges", [])):
-            key = activity_hash(obj, fields)
-            if key in duplicates:
-                raise StrategyError(
-                    format_nonunique_key_error(obj, fields, duplicates[key])
-                )
-            elif key in candidates:
-                obj["input"] = candidates[key]
+        for obj in container.get("exchanges", []):
+            # Inline predicates instead of a filter() closure - saves a
+            # Python-level call per exchange
+            if kind and obj.get("type") not in kind:
+                continue
+            if not relink and obj.get("input"):
+                continue
+            if use_name_block and _name_block_key(obj) not in name_block:
+                continue
+            key = hash_func(obj, fields)
+            hit = get_candidate(key)
+            if hit is not None:
+                if key in duplicates:
+                    # Message formatting is deferred until stringification
+                    raise NonuniqueLinkError(obj, fields, duplicates[key])
+                obj["input"] = hit
     return unlinked
 
 
@@ -237,9 +320,15 @@ def assign_only_product_as_production(db: Iterable[dict]) -> List[dict]:
     for ds in db:
         if ds.get("reference product"):
             continue
-        products = [x for x in ds.get("exchanges", []) if x.get("type") == "production"]
-        if len(products) == 1:
-            product = products[0]
+        # Single-pass scan that bails on the second production exchange
+        product = multiple = None
+        for exc in ds.get("exchanges", []):
+            if exc.get("type") == "production":
+                if product is not None:
+                    multiple = True
+                    break
+                product = exc
+        if product is not None and not multiple:
             assert product["name"]
             ds["reference product"] = (
                 product.get("reference product", []) or product["name"]
@@ -297,17 +386,18 @@ def link_technosphere_by_activity_hash(db, external_db_name=None, fields=None):
             raise StrategyError(
                 "Can't find external database {}".format(external_db_name)
             )
-        other = (
-            obj
-            for obj in Database(external_db_name)
-            if obj.get("type", "process") == "process"
+        return link_iterable_by_fields(
+            db,
+            kind=TECHNOSPHERE_TYPES,
+            fields=fields,
+            precomputed_index=_cached_database_index(
+                external_db_name,
+                tuple(fields) if fields else None,
+                databases[external_db_name].get("modified"),
+            ),
         )
-        internal = False
-    else:
-        other = None
-        internal = True
     return link_iterable_by_fields(
-        db, other, internal=internal, kind=TECHNOSPHERE_TYPES, fields=fields
+        db, internal=True, kind=TECHNOSPHERE_TYPES, fields=fields
     )
 
 
@@ -336,9 +426,13 @@ def set_code_by_activity_hash(db, overwrite=False):
     >>> db = Database('example_db')
     >>> set_code_by_activity_hash(db)
     """
-    for ds in db:
-        if "code" not in ds or overwrite:
+    if overwrite:
+        for ds in db:
             ds["code"] = activity_hash(ds)
+    else:
+        for ds in db:
+            if "code" not in ds:
+                ds["code"] = activity_hash(ds)
     return db
 
 
@@ -408,7 +502,9 @@ def drop_unlinked(db):
     ]
     """
     for ds in db:
-        ds["exchanges"] = [obj for obj in ds["exchanges"] if obj.get("input")]
+        exchanges = ds["exchanges"]
+        # Slice assignment filters in place, reusing the existing list object
+        exchanges[:] = [obj for obj in exchanges if obj.get("input")]
     return db
 
 
@@ -558,26 +654,80 @@ def drop_falsey_uncertainty_fields_but_keep_zeros(db):
     >>> drop_falsey_uncertainty_fields_but_keep_zeros(db)
     [{'name': 'B', 'exchanges': [{'loc': 0.0, 'scale': 0.5, 'minimum': nan},{'loc': 0.0, 'scale': 0.5}]}]
     """
-    uncertainty_fields = [
+    uncertainty_fields = (
         "minimum",
         "maximum",
         "scale",
         "shape",
         "loc",
-    ]
-
-    def drop_if_appropriate(exc):
-        for field in uncertainty_fields:
-            if field not in exc or exc[field] == 0:
-                continue
-            elif isinstance(exc[field], numbers.Number) and np.isnan(exc[field]):
-                continue
-            elif not exc[field]:
-                del exc[field]
+    )
 
     for ds in db:
         for exc in ds["exchanges"]:
-            drop_if_appropriate(exc)
+            for field in uncertainty_fields:
+                value = exc.get(field, 0)
+                # ``value != value`` is the IEEE-754 NaN test - much cheaper
+                # than the numbers.Number ABC check plus np.isnan dispatch
+                if value == 0 or (isinstance(value, float) and value != value):
+                    continue
+                elif not value:
+                    del exc[field]
+    return db
+
+
+def combined_cleanup(db: List[dict], database_name: str) -> List[dict]:
+    """
+    Apply the common cleanup strategies to a database in a single pass.
+
+    Fuses ``add_database_name``, ``tupleize_categories``, ``normalize_units``,
+    ``convert_uncertainty_types_to_integers``, and
+    ``drop_falsey_uncertainty_fields_but_keep_zeros``. Running them
+    consecutively walks every dataset and exchange five times; the fused loop
+    walks them once with identical results.
+
+    The individual strategies remain available - use them when a pipeline
+    needs only some of these steps or a different ordering.
+
+    Parameters
+    ----------
+    db : list[dict]
+        The database to clean up.
+    database_name : str
+        The name of the database to be added to each dataset.
+
+    Returns
+    -------
+    list[dict]
+        The updated database.
+    """
+    uncertainty_fields = ("minimum", "maximum", "scale", "shape", "loc")
+
+    for ds in db:
+        ds["database"] = database_name
+        if ds.get("categories"):
+            ds["categories"] = tuple(ds["categories"])
+        if "unit" in ds:
+            ds["unit"] = normalize_units_function(ds["unit"])
+        for param in ds.get("parameters", {}).values():
+            if "unit" in param:
+                param["unit"] = normalize_units_function(param["unit"])
+        for exc in ds.get("exchanges", []):
+            if exc.get("categories"):
+                exc["categories"] = tuple(exc["categories"])
+            if "unit" in exc:
+                exc["unit"] = normalize_units_function(exc["unit"])
+            if "reference unit" in exc:
+                exc["reference unit"] = normalize_units_function(exc["reference unit"])
+            try:
+                exc["uncertainty type"] = int(exc["uncertainty type"])
+            except:
+                pass
+            for field in uncertainty_fields:
+                value = exc.get(field, 0)
+                if value == 0 or (isinstance(value, float) and value != value):
+                    continue
+                elif not value:
+                    del exc[field]
     return db
 
 
@@ -607,14 +757,11 @@ def convert_activity_parameters_to_list(data):
     [{'name': 'C'}]
     """
 
-    def _(key, value):
-        dct = deepcopy(value)
-        dct["name"] = key
-        return dct
-
     for ds in data:
         if "parameters" in ds:
-            ds["parameters"] = [_(x, y) for x, y in ds["parameters"].items()]
+            ds["parameters"] = [
+                {**value, "name": key} for key, value in ds["parameters"].items()
+            ]
 
     return data
 
@@ -674,14 +821,18 @@ def split_exchanges(data, filter_params, changed_attributes, allocation_factors=
             if all(exchange.get(key) == value for key, value in filter_params.items()):
                 to_delete.append(index)
                 for factor, obj in zip(allocation_factors, changed_attributes):
-                    exc = deepcopy(exchange)
+                    # Shallow copy: only top-level keys are written below
+                    exc = exchange.copy()
                     exc["amount"] = exc["amount"] * factor / total
                     exc["uncertainty_type"] = 0
                     for key, value in obj.items():
                         exc[key] = value
                     to_add.append(exc)
         if to_delete:
-            for index in to_delete[::-1]:
-                del ds["exchanges"][index]
-            ds["exchanges"].extend(to_add)
+            # Rebuild once instead of deleting index-by-index, which shifts
+            # the tail of the list on every del
+            keep = set(to_delete)
+            ds["exchanges"] = [
+                exc for index, exc in enumerate(ds["exchanges"]) if index not in keep
+            ] + to_add
     return data
@@ -1,4 +1,5 @@
 import copy
+import functools
 import re
 from numbers import Number
 
@@ -15,7 +16,62 @@ from .locations import GEO_UPDATE
 
 # Pattern for SimaPro munging of ecoinvent names
 detoxify_pattern = "^(?P<name>.+?)/(?P<geo>[A-Za-z]{2,10})(/I)? [SU]$"
-detoxify_re = re.compile(detoxify_pattern)
+
+# google-re2 matches with a DFA (no backtracking); worthwhile for large
+# SimaPro imports where this pattern runs once per activity name. Optional -
+# stdlib ``re`` gives identical results.
+try:
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
+detoxify_re = _regex.compile(detoxify_pattern)
+
+
+def detoxify_specialized(name):
+    """Pure-string equivalent of ``detoxify_re.findall(name)``.
+
+    The pattern only admits one shape - ``<name>/<geo>[/I] U`` (or `` S``),
+    with a slash-free geo of 2-10 ASCII letters - so the match position is
+    fixed by the end of the string and plain ``endswith``/``rfind`` calls
+    replace the regex engine on this hot path. ``detoxify_re`` stays as the
+    reference implementation that the tests compare against.
+    """
+    if "\n" in name:
+        # The string ops diverge from the regex here: ``.`` excludes
+        # newlines and ``$`` tolerates one at the end. SimaPro CSV quoted
+        # fields can embed newlines, so defer to the regex for these
+        return detoxify_re.findall(name)
+    if "/" not in name or not name.endswith((" U", " S")):
+        return []
+    body = name[:-2]
+    # Like the regex, prefer treating a trailing "/I" as the import flag,
+    # but fall back to reading it as part of the geo (e.g. "Foo/II U")
+    if body.endswith("/I"):
+        options = ((body[:-2], "/I"), (body, ""))
+    else:
+        options = ((body, ""),)
+    for candidate, tail in options:
+        index = candidate.rfind("/")
+        geo = candidate[index + 1 :]
+        if index >= 1 and 2 <= len(geo) <= 10 and geo.isascii() and geo.isalpha():
+            return [(candidate[:index], geo, tail)]
+    return []
+
+
+@functools.lru_cache(maxsize=8192)
+def detoxify(name):
+    """Split a SimaPro-munged name into ``(name, geo)``, or return ``None``
+    if it carries no region tag.
+
+    Memoized: the same activity name recurs across many exchanges in one
+    import, so repeated names cost a cache probe instead of a fresh match.
+    """
+    found = detoxify_specialized(name)
+    if not found:
+        return None
+    head, geo, _ = found[0]
+    return head, geo
 
 
 def functional(exc: dict) -> bool:
@@ -391,19 +447,19 @@ def split_simapro_name_geo(db):
     ]
     """
     for ds in db:
-        match = detoxify_re.match(ds["name"])
-        if match:
-            gd = match.groupdict()
+        parts = detoxify(ds["name"])
+        if parts is not None:
+            name, geo = parts
             ds["simapro name"] = ds["name"]
-            ds["location"] = gd["geo"]
-            ds["name"] = ds["reference product"] = gd["name"]
+            ds["location"] = geo
+            ds["name"] = ds["reference product"] = name
         for exc in ds.get("exchanges", []):
-            match = detoxify_re.match(exc["name"])
-            if match:
-                gd = match.groupdict()
+            parts = detoxify(exc["name"])
+            if parts is not None:
+                name, geo = parts
                 exc["simapro name"] = exc["name"]
-                exc["location"] = gd["geo"]
-                exc["name"] = gd["name"]
+                exc["location"] = geo
+                exc["name"] = name
     return db
 
 
@@ -646,10 +702,9 @@ def change_electricity_unit_mj_to_kwh(db):
     """
     for ds in db:
         for exc in ds.get("exchanges", []):
-            if (
-                exc.get("name", "").lower().startswith("electricity")
-                or exc.get("name", "").lower().startswith("market for electricity")
-            ) and exc.get("unit") == "megajoule":
+            if exc.get("unit") == "megajoule" and exc.get(
+                "name", ""
+            ).lower().startswith(("electricity", "market for electricity")):
                 exc["unit"] = "kilowatt hour"
                 rescale_exchange(exc, 1 / 3.6)
     return db
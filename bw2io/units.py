@@ -1,3 +1,5 @@
+import functools
+
 UNITS_NORMALIZATION = {
     "a": "year",  # Common in LCA circles; could be confused with are
     "bq": "Becquerel",
@@ -49,9 +51,11 @@ UNITS_NORMALIZATION = {
     "wh": "watt hour",
 }
 
-normalize_units = lambda x: UNITS_NORMALIZATION.get(
-    (x.lower() if isinstance(x, str) else x), x
-)
+@functools.lru_cache(maxsize=4096)
+def normalize_units(x):
+    """Normalize a unit label. Memoized - imports see a handful of unique
+    unit strings repeated across millions of exchanges."""
+    return UNITS_NORMALIZATION.get((x.lower() if isinstance(x, str) else x), x)
 
 DEFAULT_UNITS_CONVERSION = [
     # Energy
@@ -45,17 +45,16 @@ def activity_hash(data, fields=None, case_insensitive=True):
         A MD5 hash string, hex-encoded.
 
     """
-    lower = lambda x: x.lower() if case_insensitive else x
-
-    def get_value(obj, field):
-        if isinstance(data.get(field), (list, tuple)):
-            return lower("".join(data.get(field) or []))
-        else:
-            return lower(data.get(field) or "")
-
-    fields = fields or DEFAULT_FIELDS
-    string = "".join([get_value(data, field) for field in fields])
-    return str(hashlib.md5(string.encode("utf-8")).hexdigest())
+    get = data.get
+    parts = []
+    for field in fields or DEFAULT_FIELDS:
+        value = get(field)
+        if isinstance(value, (list, tuple)):
+            value = "".join(value)
+        elif not value:
+            value = ""
+        parts.append(value.lower() if case_insensitive else value)
+    return hashlib.md5("".join(parts).encode("utf-8")).hexdigest()
 
 
 def es2_activity_hash(activity, flow):
@@ -79,7 +78,7 @@ def es2_activity_hash(activity, flow):
         The unique ID.
 
     """
-    return str(hashlib.md5((activity + flow).encode("utf-8")).hexdigest())
+    return hashlib.md5((activity + flow).encode("utf-8")).hexdigest()
 
 
 def load_json_data_file(filename):
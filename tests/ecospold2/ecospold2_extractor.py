@@ -1,6 +1,9 @@
 from pathlib import Path
 
-from bw2io.extractors.ecospold2 import Ecospold2DataExtractor
+import numpy as np
+import pytest
+
+from bw2io.extractors.ecospold2 import Ecospold2DataExtractor, exchange_arrays
 
 FIXTURES = Path(__file__).resolve().parent.parent / "fixtures" / "ecospold2"
 
@@ -278,3 +281,47 @@ def test_extraction_with_synonyms():
     }
     print(data[0])
     assert data[0] == expected
+
+
+def test_exchange_arrays():
+    exchanges = [
+        {"amount": 1.0, "loc": 2.0, "flow": "abc", "type": "technosphere"},
+        {"amount": 42.0, "name": "clay", "unit": "unit"},
+    ]
+    arrays = exchange_arrays(exchanges)
+    assert arrays["amount"].dtype == np.float64
+    assert arrays["amount"].tolist() == [1.0, 42.0]
+    assert arrays["loc"][0] == 2.0
+    # Missing numeric fields become NaN, not zero
+    assert np.isnan(arrays["loc"][1])
+    assert np.isnan(arrays["production volume"]).all()
+    assert np.isnan(arrays["scale"]).all()
+    # String fields are object arrays with None for missing values
+    assert arrays["flow"].dtype == object
+    assert arrays["flow"].tolist() == ["abc", None]
+    assert arrays["name"].tolist() == [None, "clay"]
+    assert arrays["type"].tolist() == ["technosphere", None]
+    assert arrays["unit"].tolist() == [None, "unit"]
+
+
+def test_exchange_arrays_empty():
+    arrays = exchange_arrays([])
+    assert all(len(arr) == 0 for arr in arrays.values())
+
+
+def test_exchange_arrays_non_numeric_amount():
+    with pytest.raises(ValueError):
+        exchange_arrays([{"amount": "not a number"}])
+    # None coerces to NaN like a missing field
+    assert np.isnan(exchange_arrays([{"amount": None}])["amount"][0])
+
+
+def test_exchange_arrays_from_extraction():
+    data = Ecospold2DataExtractor.extract(
+        FIXTURES
+        / "00000_11111111-2222-3333-4444-555555555555_66666666-7777-8888-9999-000000000000.spold",
+        "ei",
+    )
+    arrays = exchange_arrays(data[0]["exchanges"])
+    assert len(arrays["amount"]) == len(data[0]["exchanges"])
+    assert arrays["amount"][0] == 9999.0
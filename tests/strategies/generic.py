@@ -6,10 +6,13 @@ from bw2data import Database
 
 from bw2io.errors import StrategyError
 from bw2io.strategies import (
+    add_database_name,
     assign_only_product_as_production,
+    combined_cleanup,
     convert_uncertainty_types_to_integers,
     drop_falsey_uncertainty_fields_but_keep_zeros,
     link_technosphere_by_activity_hash,
+    normalize_units,
     set_code_by_activity_hash,
     split_exchanges,
     tupleize_categories,
@@ -498,3 +501,37 @@ def test_split_exchanges_no_changes():
         )
         == expected
     )
+
+
+def test_combined_cleanup_matches_separate_strategies():
+    data = [
+        {
+            "categories": ["resource", "in ground"],
+            "unit": "kg",
+            "parameters": {"p": {"unit": "mj", "amount": 1}},
+            "exchanges": [
+                {
+                    "categories": ["resource"],
+                    "unit": "t",
+                    "reference unit": "kwh",
+                    "uncertainty type": "2",
+                    "amount": 1,
+                    "minimum": None,
+                    "maximum": 0,
+                    "scale": "",
+                    "loc": 0.5,
+                },
+                {"unit": "km", "uncertainty type": 0, "amount": 2},
+            ],
+        }
+    ]
+    expected = normalize_units(
+        tupleize_categories(
+            convert_uncertainty_types_to_integers(
+                drop_falsey_uncertainty_fields_but_keep_zeros(
+                    add_database_name(deepcopy(data), "combined")
+                )
+            )
+        )
+    )
+    assert combined_cleanup(deepcopy(data), "combined") == expected
@@ -1,4 +1,19 @@
-from bw2io.strategies.simapro import detoxify_re, split_simapro_name_geo
+import pytest
+
+from bw2io.strategies import simapro
+from bw2io.strategies.simapro import (
+    detoxify,
+    detoxify_re,
+    detoxify_specialized,
+    split_simapro_name_geo,
+)
+
+
+def test_detoxify_re_compiled_at_import():
+    # The pattern must be compiled exactly once, at module import. The
+    # engine can be stdlib ``re`` or the optional ``re2``.
+    assert detoxify_re.pattern == simapro.detoxify_pattern
+    assert detoxify_re is simapro.detoxify_re
 
 
 def test_detoxify_re():
@@ -12,22 +27,10 @@ def test_detoxify_re():
     assert detoxify_re.search("Cheese/CENTREL S")
 
 
-def test_detoxify_re2():
-    test_strings = [
-        "Absorption chiller 100kW/CH/I U",
+DETOXIFY_CASES = [
+    ("Absorption chiller 100kW/CH/I U", [("Absorption chiller 100kW", "CH", "/I")]),
+    (
         "Disposal, solvents mixture, 16.5% water, to hazardous waste incineration/CH U",
-        "Electricity, at power plant/hard coal, IGCC, no CCS/2025/RER U",
-        "Electricity, natural gas, at fuel cell SOFC 200kWe, alloc exergy, 2030/CH U",
-        "Heat exchanger/of cogen unit 160kWe/RER/I U",
-        "Lignite, burned in power plant/post, pipeline 200km, storage 1000m/2025/RER U",
-        "Transport, lorry >28t, fleet average/CH U",
-        "Water, cooling, unspecified natural origin, CH",
-        "Water, cooling, unspecified natural origin/m3",
-        "Water/m3",
-    ]
-
-    expected_results = [
-        [("Absorption chiller 100kW", "CH", "/I")],
         [
             (
                 "Disposal, solvents mixture, 16.5% water, to hazardous waste incineration",
@@ -35,13 +38,13 @@ def test_detoxify_re2():
                 "",
             )
         ],
-        [
-            (
-                "Electricity, at power plant/hard coal, IGCC, no CCS/2025",
-                "RER",
-                "",
-            )
-        ],
+    ),
+    (
+        "Electricity, at power plant/hard coal, IGCC, no CCS/2025/RER U",
+        [("Electricity, at power plant/hard coal, IGCC, no CCS/2025", "RER", "")],
+    ),
+    (
+        "Electricity, natural gas, at fuel cell SOFC 200kWe, alloc exergy, 2030/CH U",
         [
             (
                 "Electricity, natural gas, at fuel cell SOFC 200kWe, alloc exergy, 2030",
@@ -49,7 +52,13 @@ def test_detoxify_re2():
                 "",
             )
         ],
+    ),
+    (
+        "Heat exchanger/of cogen unit 160kWe/RER/I U",
         [("Heat exchanger/of cogen unit 160kWe", "RER", "/I")],
+    ),
+    (
+        "Lignite, burned in power plant/post, pipeline 200km, storage 1000m/2025/RER U",
         [
             (
                 "Lignite, burned in power plant/post, pipeline 200km, storage 1000m/2025",
@@ -57,13 +66,47 @@ def test_detoxify_re2():
                 "",
             )
         ],
+    ),
+    (
+        "Transport, lorry >28t, fleet average/CH U",
         [("Transport, lorry >28t, fleet average", "CH", "")],
-        [],
-        [],
-        [],
-    ]
-    for string, result in zip(test_strings, expected_results):
-        assert detoxify_re.findall(string) == result
+    ),
+    ("Water, cooling, unspecified natural origin, CH", []),
+    ("Water, cooling, unspecified natural origin/m3", []),
+    ("Water/m3", []),
+]
+
+
+@pytest.mark.parametrize("string,expected", DETOXIFY_CASES)
+def test_detoxify_re2(string, expected):
+    assert detoxify_re.findall(string) == expected
+
+
+@pytest.mark.parametrize("string,expected", DETOXIFY_CASES)
+def test_detoxify_specialized_matches_regex(string, expected):
+    assert detoxify_specialized(string) == detoxify_re.findall(string) == expected
+
+
+@pytest.mark.parametrize(
+    "string",
+    [
+        # Adversarial shapes around the optional "/I" flag and geo length
+        "Foo/II U",
+        "Foo/I U",
+        "Foo/AB/I/I U",
+        "A/B/I U",
+        "/CH U",
+        "Foo/CHI/I S",
+        "Foo/ABCDEFGHIJ U",
+        "Foo/ABCDEFGHIJK U",
+        "Foo/AB1 U",
+        "Cheese/CH/I S",
+        "Foo\nBar/CH U",
+        "Foo/CH U\n",
+    ],
+)
+def test_detoxify_specialized_edge_cases(string):
+    assert detoxify_specialized(string) == detoxify_re.findall(string)
 
 
 def test_splitting_datasets():
@@ -107,3 +150,25 @@ def test_splitting_exchanges():
         }
     ]
     assert split_simapro_name_geo(db) == result
+
+
+def test_detoxify_memoized():
+    detoxify.cache_clear()
+    assert detoxify("Transport, lorry >28t, fleet average/CH U") == (
+        "Transport, lorry >28t, fleet average",
+        "CH",
+    )
+    assert detoxify("Transport, lorry >28t, fleet average/CH U") == (
+        "Transport, lorry >28t, fleet average",
+        "CH",
+    )
+    assert detoxify.cache_info().hits >= 1
+    assert detoxify("Water/m3") is None
+
+
+def test_detoxify_fast_reject():
+    # These all short-circuit before the regex runs
+    assert detoxify("Cheese U") is None
+    assert detoxify("Cheese/CH") is None
+    assert detoxify("Water/m3") is None
+    assert detoxify("Water, cooling, unspecified natural origin, CH") is None